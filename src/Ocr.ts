@@ -19,9 +19,10 @@ async function ensureInitialized(config?: OcrConfig): Promise<void> {
   cachedConfig = effectiveConfig;
 
   ocrInstance = new ReceiptOCR(effectiveConfig.runtime, effectiveConfig.fileSystemAdapter);
-  await ocrInstance.loadModel(effectiveConfig.detModelPath);
-  await ocrInstance.loadRecognitionModel(effectiveConfig.recModelPath);
+  // Validate the cheap input before paying for native session creation.
   await ocrInstance.loadCharacterDictFromArray(effectiveConfig.characterDict);
+  await ocrInstance.loadModel(effectiveConfig.detModelPath, effectiveConfig.sessionOptions);
+  await ocrInstance.loadRecognitionModel(effectiveConfig.recModelPath, effectiveConfig.sessionOptions);
 
   isInitialized = true;
 }
@@ -39,5 +40,11 @@ export const Ocr = {
     }
 
     return ocrInstance.processAndRecognize(imagePath);
+  },
+
+  reset(): void {
+    ocrInstance = null;
+    isInitialized = false;
+    cachedConfig = null;
   }
 };
@@ -1,16 +1,28 @@
 import { DetResizeMeta } from './postprocess/DetResizeMeta';
 import { DBPostProcessor } from './postprocess/DBPostProcessor';
 import { ImageUtils } from './utils/ImageUtils';
-import { warpQuadToRect } from './utils/WarpPerspective';
+import { warpQuadToNCHW } from './utils/WarpPerspective';
 import { Buffer } from 'buffer';
 import { Box } from './types/Box.interface';
 import { OcrResult } from './types/OcrResult.interface';
 import { FileSystemAdapter } from './types/FileSystemAdapter.interface';
-import { OnnxRuntime } from './types/OnnxRuntime.interface';
+import { OnnxRuntime, OnnxSessionOptions } from './types/OnnxRuntime.interface';
+
+interface LoadedSession {
+  session: any;
+  inputName: string;
+  outputName: string;
+}
+
+const MAX_IN_FLIGHT_RECOGNITIONS = 8;
+
+// Sessions are cached per runtime module, then by model path and options, so
+// re-initialisation and additional ReceiptOCR instances reuse the native session.
+const sessionCache = new WeakMap<object, Map<string, Promise<LoadedSession>>>();
 
 export class ReceiptOCR {
-  private detSession: any | null = null;
-  private recSession: any | null = null;
+  private detSession: LoadedSession | null = null;
+  private recSession: LoadedSession | null = null;
   private postProcessor: DBPostProcessor;
   private characterDict: string[] | null = null;
   private fsAdapter: FileSystemAdapter | null = null;
@@ -22,6 +34,15 @@ export class ReceiptOCR {
     this.runtime = runtime;
   }
 
+  /**
+   * Evict every cached session created through the given runtime so the next
+   * load creates a fresh one. Sessions are not released: instances that already
+   * hold them keep working.
+   */
+  static clearSessionCache(runtime: OnnxRuntime): void {
+    sessionCache.delete((runtime as any).default || runtime);
+  }
+
   async loadCharacterDictFromArray(dict: string[]): Promise<void> {
     if (!Array.isArray(dict) || !dict.every(v => typeof v === 'string')) {
       throw new Error('Invalid character dict: expected string[]');
@@ -56,93 +77,137 @@ export class ReceiptOCR {
       throw new Error('Character dict not loaded. Call loadCharacterDict() first.');
     }
 
+    const rec = this.recSession;
+    const dict = this.characterDict;
     const raw = await this.getImageBytes(imagePath);
     const decoded = ImageUtils.decodeJpeg(raw);
 
-    const results: OcrResult[] = [];
-    for (const box of boxes) {
-      const pts = box.points;
-      const wTop = Math.hypot(pts[1].x - pts[0].x, pts[1].y - pts[0].y);
-      const wBot = Math.hypot(pts[2].x - pts[3].x, pts[2].y - pts[3].y);
-      const hLeft = Math.hypot(pts[3].x - pts[0].x, pts[3].y - pts[0].y);
-      const hRight = Math.hypot(pts[2].x - pts[1].x, pts[2].y - pts[1].y);
-      const avgW = (wTop + wBot) / 2;
-      const avgH = (hLeft + hRight) / 2;
-      const targetH = 48;
-      let targetW = Math.max(16, Math.round((avgW / Math.max(1, avgH)) * targetH));
-      targetW = Math.min(targetW, 320);
-
-      const crop = warpQuadToRect(
-        decoded.data,
-        decoded.width,
-        decoded.height,
-        pts,
-        targetW,
-        targetH
-      );
-
-      const floatData = ImageUtils.pixelsToNCHW(crop, targetW, targetH);
-      const runtime = (this.runtime as any).default || this.runtime;
-      const Tensor = runtime.Tensor || (runtime as any).Tensor;
-      const inputTensor = new Tensor('float32', floatData, [1, 3, targetH, targetW]);
-
-      const feeds: Record<string, any> = {};
-      const inputNames = this.recSession.inputNames;
-      feeds[inputNames[0]] = inputTensor;
-
-      const outputMap = await this.recSession.run(feeds);
-      const outputNames = this.recSession.outputNames;
-      const outputTensor = outputMap[outputNames[0]] as any;
-      const dims = outputTensor.dims;
-
-      const timeSteps = dims[dims.length - 2] ?? 0;
-      const classes = dims[dims.length - 1] ?? 0;
-      const data = outputTensor.data;
-      const expected = timeSteps * classes;
-
-      const { text, confidence } = this.decodeCTCGreedy(
-        data.subarray(0, expected),
-        timeSteps,
-        classes,
-        this.characterDict
-      );
-
-      results.push({ box, text, confidence });
+    // Cropping is serial on the JS thread; keeping a window of native runs in
+    // flight lets inference overlap with preparing the next crops. Each worker
+    // starts the next box as soon as its current run settles, and all of them
+    // stop taking boxes after the first failure.
+    const results = new Array<OcrResult>(boxes.length);
+    let next = 0;
+    let failed = false;
+    const worker = async (): Promise<void> => {
+      while (!failed && next < boxes.length) {
+        const i = next++;
+        try {
+          results[i] = await this.recognizeBox(rec, decoded, boxes[i], dict);
+        } catch (e) {
+          failed = true;
+          throw e;
+        }
+      }
+    };
+    const workers: Promise<void>[] = [];
+    for (let w = 0; w < Math.min(MAX_IN_FLIGHT_RECOGNITIONS, boxes.length); w++) {
+      workers.push(worker());
     }
+    await Promise.all(workers);
 
     return results;
   }
 
-  async loadModel(modelPath: string | number): Promise<void> {
+  private async recognizeBox(
+    rec: LoadedSession,
+    decoded: { width: number; height: number; data: Uint8Array },
+    box: Box,
+    dict: string[]
+  ): Promise<OcrResult> {
+    const pts = box.points;
+    const wTop = Math.hypot(pts[1].x - pts[0].x, pts[1].y - pts[0].y);
+    const wBot = Math.hypot(pts[2].x - pts[3].x, pts[2].y - pts[3].y);
+    const hLeft = Math.hypot(pts[3].x - pts[0].x, pts[3].y - pts[0].y);
+    const hRight = Math.hypot(pts[2].x - pts[1].x, pts[2].y - pts[1].y);
+    const avgW = (wTop + wBot) / 2;
+    const avgH = (hLeft + hRight) / 2;
+    const targetH = 48;
+    let targetW = Math.max(16, Math.round((avgW / Math.max(1, avgH)) * targetH));
+    targetW = Math.min(targetW, 320);
+
+    const floatData = warpQuadToNCHW(
+      decoded.data,
+      decoded.width,
+      decoded.height,
+      pts,
+      targetW,
+      targetH
+    );
+    const runtime = (this.runtime as any).default || this.runtime;
+    const Tensor = runtime.Tensor || (runtime as any).Tensor;
+    const inputTensor = new Tensor('float32', floatData, [1, 3, targetH, targetW]);
+
+    const feeds: Record<string, any> = {};
+    feeds[rec.inputName] = inputTensor;
+
+    const outputMap = await rec.session.run(feeds);
+    const outputTensor = outputMap[rec.outputName] as any;
+    const dims = outputTensor.dims;
+
+    const timeSteps = dims[dims.length - 2] ?? 0;
+    const classes = dims[dims.length - 1] ?? 0;
+    const data = outputTensor.data;
+    const expected = timeSteps * classes;
+
+    const { text, confidence } = this.decodeCTCGreedy(
+      data.subarray(0, expected),
+      timeSteps,
+      classes,
+      dict
+    );
+
+    return { box, text, confidence };
+  }
+
+  async loadModel(modelPath: string | number, sessionOptions?: OnnxSessionOptions): Promise<void> {
     try {
-      // Handle both direct import and module namespace (await import)
-      const runtime = (this.runtime as any).default || this.runtime;
-      const InferenceSession = runtime.InferenceSession || (runtime as any).InferenceSession;
-      
-      if (!InferenceSession || typeof InferenceSession.create !== 'function') {
-        throw new Error('InferenceSession.create is not available. Make sure onnxruntime-react-native is properly imported.');
-      }
-      this.detSession = await InferenceSession.create(modelPath as any);
+      this.detSession = await this.loadSession(modelPath, sessionOptions);
     } catch (e) {
       throw new Error(`Failed to load detection model: ${e instanceof Error ? e.message : String(e)}`);
     }
   }
 
-  async loadRecognitionModel(modelPath: string | number): Promise<void> {
+  async loadRecognitionModel(modelPath: string | number, sessionOptions?: OnnxSessionOptions): Promise<void> {
     try {
-      // Handle both direct import and module namespace (await import)
-      const runtime = (this.runtime as any).default || this.runtime;
-      const InferenceSession = runtime.InferenceSession || (runtime as any).InferenceSession;
-      
-      if (!InferenceSession || typeof InferenceSession.create !== 'function') {
-        throw new Error('InferenceSession.create is not available. Make sure onnxruntime-react-native is properly imported.');
-      }
-      this.recSession = await InferenceSession.create(modelPath as any);
+      this.recSession = await this.loadSession(modelPath, sessionOptions);
     } catch (e) {
       throw new Error(`Failed to load recognition model: ${e instanceof Error ? e.message : String(e)}`);
     }
   }
 
+  private loadSession(modelPath: string | number, sessionOptions?: OnnxSessionOptions): Promise<LoadedSession> {
+    // Handle both direct import and module namespace (await import)
+    const runtime = (this.runtime as any).default || this.runtime;
+    const InferenceSession = runtime.InferenceSession || (runtime as any).InferenceSession;
+    
+    if (!InferenceSession || typeof InferenceSession.create !== 'function') {
+      throw new Error('InferenceSession.create is not available. Make sure onnxruntime-react-native is properly imported.');
+    }
+
+    const sessions = sessionCache.get(runtime) ?? new Map<string, Promise<LoadedSession>>();
+    sessionCache.set(runtime, sessions);
+
+    const key = JSON.stringify([modelPath, sessionOptions ?? {}]);
+    const cached = sessions.get(key);
+    if (cached) {
+      return cached;
+    }
+
+    const pending: Promise<LoadedSession> = InferenceSession.create(modelPath as any, sessionOptions).then((session: any) => ({
+      session,
+      inputName: session.inputNames[0],
+      outputName: session.outputNames[0],
+    }));
+    sessions.set(key, pending);
+    pending.catch(() => {
+      if (sessions.get(key) === pending) {
+        sessions.delete(key);
+      }
+    });
+    return pending;
+  }
+
   async loadCharacterDict(dictPath: string): Promise<void> {
     let raw: string;
     
@@ -163,6 +228,7 @@ export class ReceiptOCR {
     if (!this.detSession) {
       throw new Error('Model not loaded. Call loadModel() first.');
     }
+    const det = this.detSession;
 
     const raw = await this.getImageBytes(imagePath);
     const decoded = ImageUtils.decodeJpeg(raw);
@@ -181,31 +247,37 @@ export class ReceiptOCR {
 
     const padW = resizeMeta.padW;
     const padH = resizeMeta.padH;
-    const padded = ImageUtils.padRGBA(resizedPixels, resizeMeta.resizeW, resizeMeta.resizeH, padW, padH);
-    const floatData = ImageUtils.pixelsToNCHW(padded, padW, padH);
+    const floatData = ImageUtils.pixelsToPaddedNCHW(
+      resizedPixels,
+      resizeMeta.resizeW,
+      resizeMeta.resizeH,
+      padW,
+      padH
+    );
     const runtime = (this.runtime as any).default || this.runtime;
     const Tensor = runtime.Tensor || (runtime as any).Tensor;
     const inputTensor = new Tensor('float32', floatData, [1, 3, padH, padW]);
 
     const feeds: Record<string, any> = {};
-    const inputNames = this.detSession.inputNames;
-    feeds[inputNames[0]] = inputTensor;
+    feeds[det.inputName] = inputTensor;
 
-    const outputMap = await this.detSession.run(feeds);
-    const outputNames = this.detSession.outputNames;
-    const outputTensor = outputMap[outputNames[0]] as any;
+    const outputMap = await det.session.run(feeds);
+    const outputTensor = outputMap[det.outputName] as any;
 
     const { pred, width, height } = this.extractDetMap(outputTensor);
     const cropW = resizeMeta.resizeW;
     const cropH = resizeMeta.resizeH;
-    const cropped = new Float32Array(cropW * cropH);
-    const minW = Math.min(cropW, width);
-    const minH = Math.min(cropH, height);
-    for (let y = 0; y < minH; y++) {
-      const srcRow = y * width;
-      const dstRow = y * cropW;
-      for (let x = 0; x < minW; x++) {
-        cropped[dstRow + x] = pred[srcRow + x];
+    let cropped: Float32Array;
+    if (width === cropW && height >= cropH) {
+      // Rows are already cropW wide, so the crop is a contiguous prefix.
+      cropped = pred.subarray(0, cropW * cropH);
+    } else {
+      cropped = new Float32Array(cropW * cropH);
+      const minW = Math.min(cropW, width);
+      const minH = Math.min(cropH, height);
+      for (let y = 0; y < minH; y++) {
+        const srcRow = y * width;
+        cropped.set(pred.subarray(srcRow, srcRow + minW), y * cropW);
       }
     }
     const boxes = this.postProcessor.process(cropped, cropW, cropH, resizeMeta);
@@ -13,6 +13,12 @@ interface ClipperPath {
 
 export class DBPostProcessor {
   private config: DBPostProcessConfig;
+  private logitThresh: number;
+  // Scratch reused across calls and candidates (process() is synchronous); the
+  // binary map grows once to the largest det map seen, 960x960 by default.
+  private binaryBuf = new Uint8Array(0);
+  private contourBuf = new Int32Array(256);
+  private crossings: number[] = [];
 
   constructor(config: Partial<DBPostProcessConfig> = {}) {
     this.config = {
@@ -21,6 +27,8 @@ export class DBPostProcessor {
       maxCandidates: config.maxCandidates ?? 1000,
       unclipRatio: config.unclipRatio ?? 1.5,
     };
+    const { thresh } = this.config;
+    this.logitThresh = Math.log(thresh / (1 - thresh));
   }
 
   process(
@@ -35,40 +43,53 @@ export class DBPostProcessor {
       throw new Error(`Invalid det map size: ${pred.length} (expected ${expectedSize})`);
     }
 
-    const probMap = this.ensureProbMap(pred.subarray(0, expectedSize));
+    const detMap = pred.subarray(0, expectedSize);
+    // Sigmoid is monotone, so raw logits can be binarized against logit(thresh)
+    // without transforming the whole map; boxScore applies it per scored pixel.
+    const fromLogits = this.isLogitMap(detMap);
+    const cutoff = fromLogits ? this.logitThresh : thresh;
 
-    const binaryMap = new Uint8Array(width * height);
-    for (let i = 0; i < probMap.length; i++) {
-        binaryMap[i] = probMap[i] > thresh ? 1 : 0;
+    if (this.binaryBuf.length < expectedSize) {
+      this.binaryBuf = new Uint8Array(expectedSize);
+    }
+    const binaryMap = this.binaryBuf.subarray(0, expectedSize);
+    for (let i = 0; i < detMap.length; i++) {
+        binaryMap[i] = detMap[i] > cutoff ? 1 : 0;
     }
 
-    const contours = FindContours.findContours(binaryMap, width, height);
+    // Fewer than 3 points encloses no area, so it could never pass the area filter.
+    const contours = FindContours.findContours(binaryMap, width, height, 3);
 
     const boxes: Box[] = [];
+    const outToOrigX = resizeMeta.resizeW / width / resizeMeta.scale;
+    const outToOrigY = resizeMeta.resizeH / height / resizeMeta.scale;
+    const { origW, origH } = resizeMeta;
+    const candidates = Math.min(contours.length, maxCandidates);
 
-    for (let i = 0; i < Math.min(contours.length, maxCandidates); i++) {
+    for (let i = 0; i < candidates; i++) {
       const contour = contours[i];
       
-      const flatContour: number[] = [];
-      contour.forEach(p => { flatContour.push(p.x); flatContour.push(p.y); });
-      
-      let area = 0;
-      for (let j = 0; j < contour.length; j++) {
-          const p1 = contour[j];
-          const p2 = contour[(j + 1) % contour.length];
-          area += (p2.x - p1.x) * (p2.y + p1.y);
+      const n = contour.length;
+      if (this.contourBuf.length < n * 2) {
+        this.contourBuf = new Int32Array(n * 4);
       }
-      area = Math.abs(area) / 2.0;
+      const flatContour = this.contourBuf.subarray(0, n * 2);
+      for (let j = 0; j < n; j++) {
+          flatContour[2 * j] = contour[j].x;
+          flatContour[2 * j + 1] = contour[j].y;
+      }
+
+      const area = Math.abs(PolygonUtils.signedArea(flatContour));
 
       if (area < 3) continue;
 
       const minRect = FindContours.minAreaRect(contour);
       if (Math.min(minRect.size.width, minRect.size.height) < 3) continue;
 
-      const score = this.boxScore(probMap, width, height, contour);
+      const score = this.boxScore(detMap, width, height, flatContour, fromLogits);
       if (score < boxThresh) continue;
 
-      const unclipped = this.unclip(contour, unclipRatio, area);
+      const unclipped = this.unclip(flatContour, unclipRatio, area);
       if (!unclipped) continue;
 
       const finalRect = FindContours.minAreaRect(unclipped);
@@ -76,11 +97,9 @@ export class DBPostProcessor {
 
       const finalBoxPoints = this.rectToPoints(finalRect);
 
-      const outToInScaleX = resizeMeta.resizeW / width;
-      const outToInScaleY = resizeMeta.resizeH / height;
       const scaledPoints = finalBoxPoints.map(p => ({
-          x: Math.min(Math.max((p.x * outToInScaleX) / resizeMeta.scale, 0), resizeMeta.origW),
-          y: Math.min(Math.max((p.y * outToInScaleY) / resizeMeta.scale, 0), resizeMeta.origH)
+          x: Math.min(Math.max(p.x * outToOrigX, 0), origW),
+          y: Math.min(Math.max(p.y * outToOrigY, 0), origH)
       }));
 
       boxes.push({
@@ -92,34 +111,34 @@ export class DBPostProcessor {
     return boxes;
   }
 
-  private ensureProbMap(pred: Float32Array): Float32Array {
+  private isLogitMap(pred: Float32Array): boolean {
     const step = Math.max(1, Math.floor(pred.length / 2048));
     for (let i = 0; i < pred.length; i += step) {
       const v = pred[i];
       if (v < -0.001 || v > 1.001) {
-        const out = new Float32Array(pred.length);
-        for (let j = 0; j < pred.length; j++) {
-          out[j] = PolygonUtils.sigmoid(pred[j]);
-        }
-        return out;
+        return true;
       }
     }
 
-    return pred;
+    return false;
   }
 
   private boxScore(
       pred: Float32Array, 
       width: number, 
       height: number, 
-      contour: Point[]
+      contour: Int32Array,
+      fromLogits: boolean
   ): number {
+      const n = contour.length / 2;
       let minX = width, maxX = 0, minY = height, maxY = 0;
-      for (const p of contour) {
-          minX = Math.min(minX, Math.floor(p.x));
-          maxX = Math.max(maxX, Math.ceil(p.x));
-          minY = Math.min(minY, Math.floor(p.y));
-          maxY = Math.max(maxY, Math.ceil(p.y));
+      for (let i = 0; i < n; i++) {
+          const x = contour[2 * i];
+          const y = contour[2 * i + 1];
+          if (x < minX) minX = x;
+          if (x > maxX) maxX = x;
+          if (y < minY) minY = y;
+          if (y > maxY) maxY = y;
       }
       
       minX = Math.max(0, minX);
@@ -129,39 +148,47 @@ export class DBPostProcessor {
 
       let sum = 0;
       let count = 0;
+      const crossings = this.crossings;
 
+      // Scanline fill of the polygon restricted to its bounding box: for each row,
+      // pixels between pairs of sorted edge crossings are inside (even-odd rule).
       for (let y = minY; y <= maxY; y++) {
-          for (let x = minX; x <= maxX; x++) {
-              if (this.pointInPolygon(x, y, contour)) {
-                  sum += pred[y * width + x];
-                  count++;
+          crossings.length = 0;
+          for (let i = 0, j = n - 1; i < n; j = i++) {
+              const yi = contour[2 * i + 1], yj = contour[2 * j + 1];
+              if ((yi > y) !== (yj > y)) {
+                  const xi = contour[2 * i], xj = contour[2 * j];
+                  crossings.push((xj - xi) * (y - yi) / (yj - yi) + xi);
               }
           }
+          crossings.sort((a, b) => a - b);
+
+          const row = y * width;
+          for (let k = 0; k + 1 < crossings.length; k += 2) {
+              const x0 = Math.max(minX, Math.ceil(crossings[k]));
+              const x1 = Math.min(maxX, Math.ceil(crossings[k + 1]) - 1);
+              if (fromLogits) {
+                  for (let x = x0; x <= x1; x++) {
+                      sum += PolygonUtils.sigmoid(pred[row + x]);
+                  }
+              } else {
+                  for (let x = x0; x <= x1; x++) {
+                      sum += pred[row + x];
+                  }
+              }
+              if (x1 >= x0) count += x1 - x0 + 1;
+          }
       }
 
       return count === 0 ? 0 : sum / count;
   }
 
-  private pointInPolygon(x: number, y: number, poly: Point[]): boolean {
-      let inside = false;
-      for (let i = 0, j = poly.length - 1; i < poly.length; j = i++) {
-          const xi = poly[i].x, yi = poly[i].y;
-          const xj = poly[j].x, yj = poly[j].y;
-          
-          const intersect = ((yi > y) !== (yj > y))
-              && (x < (xj - xi) * (y - yi) / (yj - yi) + xi);
-          if (intersect) inside = !inside;
-      }
-      return inside;
-  }
-
-  private unclip(points: Point[], unclipRatio: number, area: number): Point[] | null {
+  private unclip(points: Int32Array, unclipRatio: number, area: number): Point[] | null {
+      const n = points.length / 2;
       let perimeter = 0;
-      for (let i = 0; i < points.length; i++) {
-          const p1 = points[i];
-          const p2 = points[(i + 1) % points.length];
-          const dx = p1.x - p2.x;
-          const dy = p1.y - p2.y;
+      for (let i = 0, j = n - 1; i < n; j = i++) {
+          const dx = points[2 * i] - points[2 * j];
+          const dy = points[2 * i + 1] - points[2 * j + 1];
           perimeter += Math.sqrt(dx * dx + dy * dy);
       }
       
@@ -170,12 +197,15 @@ export class DBPostProcessor {
       const distance = (area * unclipRatio) / perimeter;
       const scale = 1000.0;
 
-      const path: ClipperPath[] = points.map(p => ({
-          X: Math.round(p.x * scale),
-          Y: Math.round(p.y * scale)
-      }));
+      // Contour vertices are integer pixels, so scaling them is already exact.
+      const path: ClipperPath[] = new Array(n);
+      for (let i = 0; i < n; i++) {
+          path[i] = { X: points[2 * i] * scale, Y: points[2 * i + 1] * scale };
+      }
 
-      const co = new ClipperLib.ClipperOffset();
+      // Arc tolerance is in path units: a quarter pixel, as pyclipper uses on pixel
+      // coordinates, instead of the default 0.25 / scale px.
+      const co = new ClipperLib.ClipperOffset(2.0, 0.25 * scale);
       co.AddPath(path, ClipperLib.JoinType.jtRound, ClipperLib.EndType.etClosedPolygon);
 
       const solution: ClipperPath[][] = [];
@@ -203,10 +233,12 @@ export class DBPostProcessor {
 
       if (!bestPath) return null;
 
-      return bestPath.map(p => ({
-          x: p.X / scale,
-          y: p.Y / scale
-      }));
+      const inv = 1 / scale;
+      const expanded: Point[] = new Array(bestPath.length);
+      for (let i = 0; i < bestPath.length; i++) {
+          expanded[i] = { x: bestPath[i].X * inv, y: bestPath[i].Y * inv };
+      }
+      return expanded;
   }
 
   private rectToPoints(rect: { center: Point, size: {width: number, height: number}, angle: number }): Point[] {
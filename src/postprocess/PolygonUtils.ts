@@ -1,28 +1,26 @@
 export class PolygonUtils {
-  static isClockwise(points: number[]): boolean {
+  static isClockwise(points: ArrayLike<number>): boolean {
     if (points.length < 6) {
       return false;
     }
 
-    const n = points.length / 2;
-    let area = 0.0;
+    return this.signedArea(points) < 0;
+  }
 
-    for (let i = 0; i < n; i++) {
-      const x = points[2 * i];
-      const y = points[2 * i + 1];
-      const nextIdx = (i + 1) % n;
-      const nextX = points[2 * nextIdx];
-      const nextY = points[2 * nextIdx + 1];
+  static signedArea(points: ArrayLike<number>): number {
+    const n = points.length >> 1;
+    let area = 0.0;
 
-      area += (nextX - x) * (nextY + y);
+    for (let i = 0, j = n - 1; i < n; j = i++) {
+      area += (points[2 * i] - points[2 * j]) * (points[2 * i + 1] + points[2 * j + 1]);
     }
 
-    return area < 0;
+    return area / 2.0;
   }
 
   static sigmoid(x: number): number {
-    const clipped = Math.max(-500, Math.min(500, x));
-    return 1.0 / (1.0 + Math.exp(-clipped));
+    // Math.exp overflows to Infinity for very negative x, which still yields 0.
+    return 1.0 / (1.0 + Math.exp(-x));
   }
 }
 
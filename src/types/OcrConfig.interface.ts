@@ -1,5 +1,5 @@
 import { FileSystemAdapter } from './FileSystemAdapter.interface';
-import { OnnxRuntime } from './OnnxRuntime.interface';
+import { OnnxRuntime, OnnxSessionOptions } from './OnnxRuntime.interface';
 
 export interface OcrConfig {
   runtime: OnnxRuntime;
@@ -8,5 +8,6 @@ export interface OcrConfig {
   characterDict: string[];
   characterDictPath?: string;
   fileSystemAdapter?: FileSystemAdapter;
+  sessionOptions?: OnnxSessionOptions; // forwarded to InferenceSession.create for both models
 }
 
@@ -15,4 +15,7 @@ export type OnnxRuntime = typeof import('onnxruntime-react-native') extends infe
     : any
   : any;
 
-
+/**
+ * Options forwarded to InferenceSession.create for the detection and recognition models
+ */
+export type OnnxSessionOptions = import('onnxruntime-react-native').InferenceSession.SessionOptions;
@@ -19,6 +19,9 @@ declare module 'js-clipper' {
   }
 
   export class ClipperOffset {
+    constructor(miterLimit?: number, arcTolerance?: number);
+    MiterLimit: number;
+    ArcTolerance: number;
     AddPath(path: IntPoint[], joinType: JoinType, endType: EndType): void;
     Execute(solution: IntPoint[][], delta: number): void;
   }
@@ -1,27 +1,30 @@
 import { Point } from '../types/Point.interface';
 
 export class FindContours {
-  static findContours(data: Uint8Array | Float32Array | number[], width: number, height: number): Point[][] {
+  static findContours(
+    data: Uint8Array | Float32Array | number[],
+    width: number,
+    height: number,
+    minPoints: number = 1
+  ): Point[][] {
     const contours: Point[][] = [];
     const visited = new Uint8Array(width * height);
-    const isForeground = (idx: number) => data[idx] > 0;
+    const offsets = [
+      -width - 1, -width, -width + 1,
+      -1, 1,
+      width - 1, width, width + 1,
+    ];
 
     for (let y = 0; y < height; y++) {
       for (let x = 0; x < width; x++) {
         const idx = y * width + x;
-        if (isForeground(idx) && !visited[idx]) {
+        if (data[idx] > 0 && !visited[idx]) {
           let isBorder = false;
           if (x === 0 || x === width - 1 || y === 0 || y === height - 1) {
             isBorder = true;
           } else {
-            const offsets = [
-              -width - 1, -width, -width + 1,
-              -1, 1,
-              width - 1, width, width + 1,
-            ];
-
-            for (const off of offsets) {
-              if (!isForeground(idx + off)) {
+            for (let k = 0; k < 8; k++) {
+              if (!(data[idx + offsets[k]] > 0)) {
                 isBorder = true;
                 break;
               }
@@ -30,7 +33,7 @@ export class FindContours {
           
           if (isBorder) {
              const contour = this.traceContour(data, width, height, x, y, visited);
-             if (contour.length > 0) {
+             if (contour.length >= minPoints) {
                contours.push(contour);
              }
           }
@@ -80,6 +83,8 @@ export class FindContours {
     visited[startIdx] = 1;
 
     let currentBacktrack = backtrackIdx;
+    let stepDir = -1;
+    let lastDir = -1;
     let iter = 0;
     const maxIter = width * height; 
 
@@ -95,6 +100,7 @@ export class FindContours {
                     pX = nx;
                     pY = ny;
                     currentBacktrack = (checkIdx + 4) % 8;
+                    stepDir = checkIdx;
                     foundNext = true;
                     break;
                 }
@@ -109,7 +115,14 @@ export class FindContours {
             break;
         }
         
-        contour.push({x: pX, y: pY});
+        // Like CHAIN_APPROX_SIMPLE: a step in the same direction extends the current
+        // straight run, so only its end point is kept.
+        if (stepDir === lastDir) {
+            contour[contour.length - 1] = {x: pX, y: pY};
+        } else {
+            contour.push({x: pX, y: pY});
+        }
+        lastDir = stepDir;
         visited[pY * width + pX] = 1;
         iter++;
     }
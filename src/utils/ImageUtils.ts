@@ -1,29 +1,49 @@
 import * as jpeg from 'jpeg-js';
 
 export class ImageUtils {
-  static pixelsToNCHW(
+  static pixelsToPaddedNCHW(
     pixels: Uint8Array,
     width: number,
     height: number,
+    padW: number,
+    padH: number,
     mean: number[] = [0.485, 0.456, 0.406],
     std: number[] = [0.229, 0.224, 0.225],
     scale: number = 1.0 / 255.0
   ): Float32Array {
     const channels = 3;
     const stride = pixels.length / (width * height);
-    const float32Data = new Float32Array(channels * height * width);
+    const plane = padW * padH;
+    const float32Data = new Float32Array(channels * plane);
 
-    const gOffset = width * height;
-    const bOffset = 2 * width * height;
+    const gOffset = plane;
+    const bOffset = 2 * plane;
 
-    for (let i = 0; i < width * height; i++) {
-      const r = pixels[i * stride] * scale;
-      const g = pixels[i * stride + 1] * scale;
-      const b = pixels[i * stride + 2] * scale;
+    // (v * scale - mean) / std folded into one multiply-add per channel.
+    const rA = scale / std[0], rB = -mean[0] / std[0];
+    const gA = scale / std[1], gB = -mean[1] / std[1];
+    const bA = scale / std[2], bB = -mean[2] / std[2];
 
-      float32Data[i] = (r - mean[0]) / std[0];
-      float32Data[gOffset + i] = (g - mean[1]) / std[1];
-      float32Data[bOffset + i] = (b - mean[2]) / std[2];
+    for (let y = 0; y < height; y++) {
+      const row = y * padW;
+      let src = y * width * stride;
+      for (let x = 0; x < width; x++, src += stride) {
+        float32Data[row + x] = pixels[src] * rA + rB;
+        float32Data[gOffset + row + x] = pixels[src + 1] * gA + gB;
+        float32Data[bOffset + row + x] = pixels[src + 2] * bA + bB;
+      }
+      // Padding is black, i.e. the normalized value of a zero pixel.
+      if (padW > width) {
+        float32Data.fill(rB, row + width, row + padW);
+        float32Data.fill(gB, gOffset + row + width, gOffset + row + padW);
+        float32Data.fill(bB, bOffset + row + width, bOffset + row + padW);
+      }
+    }
+    if (padH > height) {
+      const tail = height * padW;
+      float32Data.fill(rB, tail, plane);
+      float32Data.fill(gB, gOffset + tail, gOffset + plane);
+      float32Data.fill(bB, bOffset + tail, bOffset + plane);
     }
 
     return float32Data;
@@ -76,39 +96,4 @@ export class ImageUtils {
     }
     return out;
   }
-
-  static padRGBA(
-    pixels: Uint8Array,
-    width: number,
-    height: number,
-    padW: number,
-    padH: number
-  ): Uint8Array {
-    const out = new Uint8Array(padW * padH * 4);
-    const rowBytesSrc = width * 4;
-    const rowBytesDst = padW * 4;
-    for (let y = 0; y < height; y++) {
-      const srcOffset = y * rowBytesSrc;
-      const dstOffset = y * rowBytesDst;
-      out.set(pixels.subarray(srcOffset, srcOffset + rowBytesSrc), dstOffset);
-      for (let x = width; x < padW; x++) {
-        const i = dstOffset + x * 4;
-        out[i] = 0;
-        out[i + 1] = 0;
-        out[i + 2] = 0;
-        out[i + 3] = 255;
-      }
-    }
-    for (let y = height; y < padH; y++) {
-      const dstOffset = y * rowBytesDst;
-      for (let x = 0; x < padW; x++) {
-        const i = dstOffset + x * 4;
-        out[i] = 0;
-        out[i + 1] = 0;
-        out[i + 2] = 0;
-        out[i + 3] = 255;
-      }
-    }
-    return out;
-  }
 }
@@ -44,53 +44,19 @@ function solveHomography(src: XY[], dst: XY[]): number[] {
   return h;
 }
 
-function bilinearSample(
-  src: Uint8Array,
-  sw: number,
-  sh: number,
-  x: number,
-  y: number
-): [number, number, number] {
-  const ix = Math.floor(x);
-  const iy = Math.floor(y);
-  const fx = x - ix;
-  const fy = y - iy;
-
-  const clamp = (v: number, min: number, max: number) => Math.max(min, Math.min(max, v));
-  const ix1 = clamp(ix, 0, sw - 1);
-  const iy1 = clamp(iy, 0, sh - 1);
-  const ix2 = clamp(ix + 1, 0, sw - 1);
-  const iy2 = clamp(iy + 1, 0, sh - 1);
-
-  const idx = (xx: number, yy: number) => (yy * sw + xx) * 4;
-  const i11 = idx(ix1, iy1);
-  const i21 = idx(ix2, iy1);
-  const i12 = idx(ix1, iy2);
-  const i22 = idx(ix2, iy2);
-
-  const w11 = (1 - fx) * (1 - fy);
-  const w21 = fx * (1 - fy);
-  const w12 = (1 - fx) * fy;
-  const w22 = fx * fy;
-
-  const r =
-    src[i11] * w11 + src[i21] * w21 + src[i12] * w12 + src[i22] * w22;
-  const g =
-    src[i11 + 1] * w11 + src[i21 + 1] * w21 + src[i12 + 1] * w12 + src[i22 + 1] * w22;
-  const b =
-    src[i11 + 2] * w11 + src[i21 + 2] * w21 + src[i12 + 2] * w12 + src[i22 + 2] * w22;
-  return [r, g, b];
-}
-
-export function warpQuadToRect(
+export function warpQuadToNCHW(
   srcPixels: Uint8Array,
   srcW: number,
   srcH: number,
   quad: XY[],
   dstW: number,
-  dstH: number
-): Uint8Array {
-  const dstPixels = new Uint8Array(dstW * dstH * 4);
+  dstH: number,
+  mean: number[] = [0.485, 0.456, 0.406],
+  std: number[] = [0.229, 0.224, 0.225],
+  scale: number = 1.0 / 255.0
+): Float32Array {
+  const plane = dstW * dstH;
+  const dst = new Float32Array(3 * plane);
   const dstQuad: XY[] = [
     { x: 0, y: 0 },
     { x: dstW - 1, y: 0 },
@@ -99,18 +65,49 @@ export function warpQuadToRect(
   ];
   const H = solveHomography(dstQuad, quad);
 
+  const maxX = srcW - 1;
+  const maxY = srcH - 1;
+  // Same folded normalization as ImageUtils.pixelsToPaddedNCHW.
+  const rA = scale / std[0], rB = -mean[0] / std[0];
+  const gA = scale / std[1], gB = -mean[1] / std[1];
+  const bA = scale / std[2], bB = -mean[2] / std[2];
+
   for (let y = 0; y < dstH; y++) {
     for (let x = 0; x < dstW; x++) {
       const u = (H[0] * x + H[1] * y + H[2]) / (H[6] * x + H[7] * y + H[8]);
       const v = (H[3] * x + H[4] * y + H[5]) / (H[6] * x + H[7] * y + H[8]);
-      const [r, g, b] = bilinearSample(srcPixels, srcW, srcH, u, v);
-      const idx = (y * dstW + x) * 4;
-      dstPixels[idx] = r;
-      dstPixels[idx + 1] = g;
-      dstPixels[idx + 2] = b;
-      dstPixels[idx + 3] = 255;
+
+      // Bilinear sample with edge clamping, inlined to avoid per-pixel closures
+      // and tuple allocations.
+      const ix = Math.floor(u);
+      const iy = Math.floor(v);
+      const fx = u - ix;
+      const fy = v - iy;
+      const ix1 = ix < 0 ? 0 : ix > maxX ? maxX : ix;
+      const iy1 = iy < 0 ? 0 : iy > maxY ? maxY : iy;
+      const ix2 = ix + 1 < 0 ? 0 : ix + 1 > maxX ? maxX : ix + 1;
+      const iy2 = iy + 1 < 0 ? 0 : iy + 1 > maxY ? maxY : iy + 1;
+
+      const i11 = (iy1 * srcW + ix1) * 4;
+      const i21 = (iy1 * srcW + ix2) * 4;
+      const i12 = (iy2 * srcW + ix1) * 4;
+      const i22 = (iy2 * srcW + ix2) * 4;
+
+      const w11 = (1 - fx) * (1 - fy);
+      const w21 = fx * (1 - fy);
+      const w12 = (1 - fx) * fy;
+      const w22 = fx * fy;
+
+      // Samples are truncated to 8 bits, as the RGBA crop buffer used to store them.
+      const r = (srcPixels[i11] * w11 + srcPixels[i21] * w21 + srcPixels[i12] * w12 + srcPixels[i22] * w22) | 0;
+      const g = (srcPixels[i11 + 1] * w11 + srcPixels[i21 + 1] * w21 + srcPixels[i12 + 1] * w12 + srcPixels[i22 + 1] * w22) | 0;
+      const b = (srcPixels[i11 + 2] * w11 + srcPixels[i21 + 2] * w21 + srcPixels[i12 + 2] * w12 + srcPixels[i22 + 2] * w22) | 0;
+
+      const idx = y * dstW + x;
+      dst[idx] = r * rA + rB;
+      dst[plane + idx] = g * gA + gB;
+      dst[2 * plane + idx] = b * bA + bB;
     }
   }
-  return dstPixels;
+  return dst;
 }
-